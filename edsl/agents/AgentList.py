@@ -435,10 +435,8 @@ class AgentList(UserList, Base):
                 return None
             else:
                 raise e
-        return (
-            self.to_scenario_list()
-            .to_dataset()
-            .table(*fields, tablefmt=tablefmt, pretty_labels=pretty_labels)
+        return self.to_dataset().table(
+            *fields, tablefmt=tablefmt, pretty_labels=pretty_labels
         )
 
     def to_dataset(self, traits_only: bool = True):
@@ -455,17 +453,14 @@ class AgentList(UserList, Base):
         from edsl.results.Dataset import Dataset
         from collections import defaultdict
 
-        agent_trait_keys = []
-        for agent in self:
-            agent_keys = list(agent.traits.keys())
-            for key in agent_keys:
-                if key not in agent_trait_keys:
-                    agent_trait_keys.append(key)
+        # Agent.traits returns a fresh copy on every access, so read it once per agent
+        agent_traits = [agent.traits for agent in self]
+        agent_trait_keys = list(dict.fromkeys(k for t in agent_traits for k in t))
 
         data = defaultdict(list)
-        for agent in self:
+        for agent, traits in zip(self, agent_traits):
             for trait_key in agent_trait_keys:
-                data[trait_key].append(agent.traits.get(trait_key, None))
+                data[trait_key].append(traits.get(trait_key, None))
             if not traits_only:
                 data["agent_parameters"].append(
                     {"instruction": agent.instruction, "agent_name": agent.name}
@@ -116,6 +116,8 @@ service_to_api_keyname = {
 
 
 class TokenPricing:
+    __slots__ = ("model_name", "prompt_token_price", "completion_token_price")
+
     def __init__(
         self,
         *,
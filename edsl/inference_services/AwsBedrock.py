@@ -1,5 +1,6 @@
 import os
-from typing import Any, List, Optional
+import asyncio
+from typing import Any, Dict, List, Optional
 import re
 import boto3
 from botocore.exceptions import ClientError
@@ -30,6 +31,24 @@ class AwsBedrockService(InferenceServiceABC):
     ]
     _models_list_cache: List[str] = []
 
+    # boto3 clients are expensive to build and thread-safe, so keep one per region
+    _client_instances: Dict[str, Any] = {}
+    _runtime_client_instances: Dict[str, Any] = {}
+
+    @classmethod
+    def client(cls, region: str):
+        if region not in cls._client_instances:
+            cls._client_instances[region] = boto3.client("bedrock", region_name=region)
+        return cls._client_instances[region]
+
+    @classmethod
+    def runtime_client(cls, region: str):
+        if region not in cls._runtime_client_instances:
+            cls._runtime_client_instances[region] = boto3.client(
+                "bedrock-runtime", region_name=region
+            )
+        return cls._runtime_client_instances[region]
+
     @classmethod
     def available(cls):
         """Fetch available models from AWS Bedrock."""
@@ -37,7 +56,7 @@ class AwsBedrockService(InferenceServiceABC):
         region = os.getenv("AWS_REGION", "us-east-1")
 
         if not cls._models_list_cache:
-            client = boto3.client("bedrock", region_name=region)
+            client = cls.client(region)
             all_models_ids = [
                 x["modelId"] for x in client.list_foundation_models()["modelSummaries"]
             ]
@@ -83,7 +102,7 @@ class AwsBedrockService(InferenceServiceABC):
                 )  # call to check the if env variables are set.
 
                 region = os.getenv("AWS_REGION", "us-east-1")
-                client = boto3.client("bedrock-runtime", region_name=region)
+                client = cls.runtime_client(region)
 
                 conversation = [
                     {
@@ -97,7 +116,9 @@ class AwsBedrockService(InferenceServiceABC):
                     }
                 ]
                 try:
-                    response = client.converse(
+                    # converse is blocking; run it off the event loop
+                    response = await asyncio.to_thread(
+                        client.converse,
                         modelId=self._model_,
                         messages=conversation,
                         inferenceConfig={
@@ -3,6 +3,7 @@ from typing import Any, List, Optional, Dict, NewType
 import os
 
 
+import httpx
 import openai
 
 from edsl.inference_services.InferenceServiceABC import InferenceServiceABC
@@ -52,17 +53,56 @@ class OpenAIService(InferenceServiceABC):
         client = cls._sync_client_instances[api_key]
         return client
 
+    @classmethod
+    def async_http_client(cls) -> httpx.AsyncClient:
+        """Return an HTTP client that keeps more idle connections alive.
+
+        Mirrors the openai library defaults (600s timeout, 1000 connections,
+        redirects followed) but raises the keep-alive pool from 100, so busy
+        jobs stop re-opening TLS connections. A plain httpx client is used
+        because older openai releases lack DefaultAsyncHttpxClient, and the
+        same client is handed to other OpenAI-compatible SDKs such as groq.
+        """
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout=600, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=1000,
+                max_keepalive_connections=1000,
+            ),
+            follow_redirects=True,
+        )
+
     @classmethod
     def async_client(cls, api_key):
         if api_key not in cls._async_client_instances:
             client = cls._async_client_(
                 api_key=api_key,
                 base_url=cls._base_url_,
+                http_client=cls.async_http_client(),
             )
             cls._async_client_instances[api_key] = client
         client = cls._async_client_instances[api_key]
         return client
 
+    @classmethod
+    def cached_rate_limits(cls) -> dict[str, Any]:
+        """Return rpm/tpm from the cached OpenAI rate-limit headers.
+
+        Probing with get_headers() costs a paid completion, so fall back to
+        fixed defaults when the cache is missing or malformed.
+        """
+        headers = rate_limits.get("openai", {})
+        try:
+            return {
+                "rpm": int(headers["x-ratelimit-limit-requests"]),
+                "tpm": int(headers["x-ratelimit-limit-tokens"]),
+            }
+        except (KeyError, ValueError):
+            return {
+                "rpm": 10_000,
+                "tpm": 2_000_000,
+            }
+
     model_exclude_list = [
         "whisper-1",
         "davinci-002",
@@ -159,23 +199,7 @@ class OpenAIService(InferenceServiceABC):
                 return dict(response.headers)
 
             def get_rate_limits(self) -> dict[str, Any]:
-                try:
-                    if "openai" in rate_limits:
-                        headers = rate_limits["openai"]
-
-                    else:
-                        headers = self.get_headers()
-
-                except Exception as e:
-                    return {
-                        "rpm": 10_000,
-                        "tpm": 2_000_000,
-                    }
-                else:
-                    return {
-                        "rpm": int(headers["x-ratelimit-limit-requests"]),
-                        "tpm": int(headers["x-ratelimit-limit-tokens"]),
-                    }
+                return cls.cached_rate_limits()
 
             async def async_execute_model_call(
                 self,
@@ -2,7 +2,6 @@ import aiohttp
 import json
 import requests
 from typing import Any, List, Optional
-from edsl.inference_services.rate_limits_cache import rate_limits
 
 # from edsl.inference_services.InferenceServiceABC import InferenceServiceABC
 from edsl.language_models import LanguageModel
@@ -88,23 +87,7 @@ class PerplexityService(OpenAIService):
                 return dict(response.headers)
 
             def get_rate_limits(self) -> dict[str, Any]:
-                try:
-                    if "openai" in rate_limits:
-                        headers = rate_limits["openai"]
-
-                    else:
-                        headers = self.get_headers()
-
-                except Exception as e:
-                    return {
-                        "rpm": 10_000,
-                        "tpm": 2_000_000,
-                    }
-                else:
-                    return {
-                        "rpm": int(headers["x-ratelimit-limit-requests"]),
-                        "tpm": int(headers["x-ratelimit-limit-tokens"]),
-                    }
+                return cls.cached_rate_limits()
 
             async def async_execute_model_call(
                 self,
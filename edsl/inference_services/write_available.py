@@ -1,10 +1,20 @@
+from concurrent.futures import ThreadPoolExecutor
+from pprint import pformat
+
 from edsl.inference_services.registry import default
 
 
 def write_available():
-    d = {}
-    for service in default.services:
-        d[service._inference_service_] = service.available()
+    # each service.available() is a blocking network call, so query them concurrently
+    max_workers = max(1, min(len(default.services), 10))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_to_service = {
+            executor.submit(service.available): service for service in default.services
+        }
+        d = {
+            service._inference_service_: future.result()
+            for future, service in future_to_service.items()
+        }
 
     with open("models_available_cache.py", "w") as f:
-        f.write(f"models_available = {d}")
+        f.write(f"models_available = {pformat(d)}\n")
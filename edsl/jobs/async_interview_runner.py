@@ -83,7 +83,7 @@ class AsyncInterviewRunner:
     ) -> AsyncGenerator[tuple[Result, Interview], None]:
         """Creates and processes tasks asynchronously, yielding results as they complete.
 
-        Uses TaskGroup for structured concurrency and automated cleanup.
+        At most MAX_CONCURRENT interview tasks exist at once; pending tasks are cancelled on exit.
         Results are yielded as they become available while maintaining controlled concurrency.
         """
         interviews = list(self._expand_interviews())
@@ -106,33 +106,38 @@ class AsyncInterviewRunner:
                 # logger.error(f"Task failed with error: {e}")
                 return None
 
-        # Process interviews in chunks
-        for i in range(0, len(interviews), self.MAX_CONCURRENT):
-            chunk = interviews[i : i + self.MAX_CONCURRENT]
-            tasks = [
-                asyncio.create_task(_process_single_interview(interview, idx))
-                for idx, interview in enumerate(chunk, start=i)
-            ]
-
-            try:
-                # Wait for all tasks in the chunk to complete
-                results = await asyncio.gather(
-                    *tasks,
-                    return_exceptions=not self.run_config.parameters.stop_on_exception
+        # A sliding window: a new interview starts as soon as any running one
+        # finishes, and only the running interviews have a task.
+        remaining = iter(enumerate(interviews))
+
+        def _fill(pending: set) -> None:
+            while len(pending) < self.MAX_CONCURRENT:
+                next_interview = next(remaining, None)
+                if next_interview is None:
+                    return
+                idx, interview = next_interview
+                pending.add(
+                    asyncio.create_task(_process_single_interview(interview, idx))
                 )
 
-                # Process successful results
-                for result in (r for r in results if r is not None):
-                    yield result.result, result.interview
-
-            except Exception as e:
-                if self.run_config.parameters.stop_on_exception:
-                    raise
-                # logger.error(f"Chunk processing failed with error: {e}")
-                continue
-
-            finally:
-                # Clean up any remaining tasks
-                for task in tasks:
-                    if not task.done():
-                        task.cancel()
+        pending = set()
+        try:
+            _fill(pending)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                _fill(pending)
+                # Results carry their order, so they can be yielded as they complete
+                for task in done:
+                    result = task.result()
+                    if result is not None:
+                        yield result.result, result.interview
+
+        finally:
+            # Clean up any remaining tasks, and wait for them to unwind so
+            # none are left pending when the loop shuts down
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
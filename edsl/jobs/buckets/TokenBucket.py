@@ -1,12 +1,7 @@
 from typing import Union, List, Any, Optional
 import asyncio
 import time
-from threading import RLock
-from edsl.jobs.decorators import synchronized_class
-
-from typing import Union, List, Any, Optional
-import asyncio
-import time
+from collections import deque
 from threading import RLock
 from edsl.jobs.decorators import synchronized_class
 
@@ -17,6 +12,11 @@ class TokenBucket:
     It can operate either locally or remotely via a REST API based on initialization parameters.
     """
 
+    # the log is only used for visualization, so keep just the most recent entries
+    max_log_length = 10_000
+    # waits shorter than this just yield to the event loop instead of arming a timer
+    min_wait_time = 0.001
+
     def __new__(
         cls,
         *,
@@ -79,7 +79,7 @@ class TokenBucket:
         self.refill_rate = refill_rate  # Rate at which tokens are refilled
         self._old_refill_rate = refill_rate
         self.last_refill = time.monotonic()  # Last refill time
-        self.log: List[Any] = []
+        self.log: deque = deque(maxlen=self.max_log_length)
         self.turbo_mode = False
 
         self.creation_time = time.monotonic()
@@ -198,6 +198,11 @@ class TokenBucket:
         12.100000000000001
         """
         self.num_requests += amount
+        if self.refill_rate == float("inf"):
+            # turbo mode or an infinity bucket: tokens are always available
+            self.num_released += amount
+            return None
+
         if amount >= self.capacity:
             if not cheat_bucket_capacity:
                 msg = f"Requested amount exceeds bucket capacity. Bucket capacity: {self.capacity}, requested amount: {amount}. As the bucket never overflows, the requested amount will never be available."
@@ -206,16 +211,19 @@ class TokenBucket:
                 self.capacity = amount * 1.10
                 self._old_capacity = self.capacity
 
-        start_time = time.monotonic()
-        while True:
-            self.refill()  # Refill based on elapsed time
-            if self.tokens >= amount:
-                self.tokens -= amount
-                break
-
-            wait_time = self.wait_time(amount)
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
+        # Reserve the tokens up front, letting the balance go negative, and sleep
+        # once for exactly the deficit. Later callers queue behind the debt, so
+        # waiters are served in order instead of all waking up to re-poll.
+        self.refill()
+        self.tokens -= amount
+        if self.tokens < 0:
+            wait_time = -self.tokens / self.refill_rate
+            try:
+                await asyncio.sleep(wait_time if wait_time >= self.min_wait_time else 0)
+            except asyncio.CancelledError:
+                # the caller gave up; hand back its reservation
+                self.tokens += amount
+                raise
 
         self.num_released += amount
         now = time.monotonic()
@@ -223,7 +231,7 @@ class TokenBucket:
         return None
 
     def get_log(self) -> list[tuple]:
-        return self.log
+        return list(self.log)
 
     def visualize(self):
         """Visualize the token bucket over time."""
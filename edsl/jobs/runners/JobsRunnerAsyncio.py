@@ -44,16 +44,12 @@ class JobsRunnerAsyncio:
             data.append(result)
             task_history.add_interview(interview)
 
-        results = Results(survey=self.jobs.survey, task_history=task_history, data=data)
-
-        relevant_cache = results.relevant_cache(self.environment.cache)
+        # interviews finish out of order; restore the order they were created in
+        data.sort(key=lambda result: result.order)
 
-        return Results(
-            survey=self.jobs.survey,
-            task_history=task_history,
-            data=data,
-            cache=relevant_cache,
-        )
+        results = Results(survey=self.jobs.survey, task_history=task_history, data=data)
+        results.cache = results.relevant_cache(self.environment.cache)
+        return results
 
     def simple_run(self):
         data = asyncio.run(self.run_async())
@@ -96,8 +92,11 @@ class JobsRunnerAsyncio:
         async def get_results(results) -> None:
             """Conducted the interviews and append to the results list."""
             result_generator = AsyncInterviewRunner(self.jobs, run_config)
+            # Results.append keeps the list sorted on every insert, which is
+            # quadratic when interviews finish out of order; collect them
+            # directly and sort once when the run ends.
             async for result, interview in result_generator.run():
-                results.append(result)
+                results.data.append(result)
                 results.task_history.add_interview(interview)
 
             self.completed = True
@@ -150,6 +149,7 @@ class JobsRunnerAsyncio:
             if exception_to_raise:
                 raise exception_to_raise
 
+            results.data.sort(key=lambda result: result.order)
             relevant_cache = results.relevant_cache(self.environment.cache)
             results.cache = relevant_cache
             # breakpoint()
@@ -60,6 +60,9 @@ class StatisticsTracker:
 
 
 class JobsRunnerStatusBase(ABC):
+    # Upper bound for the update interval while no interviews are completing.
+    max_refresh_rate = 8
+
     def __init__(
         self,
         jobs_runner: "JobsRunnerAsyncio",
@@ -218,9 +221,21 @@ class JobsRunnerStatusBase(ABC):
             return {"throughput": (value, 2, "interviews/sec.")}
 
     def update_progress(self, stop_event):
+        # Back off while nothing completes, so long-running interviews don't
+        # produce a stream of near-identical updates; reset on progress.
+        interval = self.refresh_rate
+        last_completed = None
         while not stop_event.is_set():
             self.send_status_update()
-            time.sleep(self.refresh_rate)
+            completed = self.stats_tracker.completed_count
+            if completed == last_completed:
+                interval = min(
+                    interval * 2, max(self.max_refresh_rate, self.refresh_rate)
+                )
+            else:
+                interval = self.refresh_rate
+            last_completed = completed
+            stop_event.wait(interval)
         self.send_status_update()
 
     @abstractmethod
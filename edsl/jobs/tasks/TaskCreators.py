@@ -26,10 +26,12 @@ class TaskCreators(UserDict):
         """
         cached_tokens = TokenUsage(from_cache=True)
         new_tokens = TokenUsage(from_cache=False)
+        # accumulate in place rather than allocating a new TokenUsage per task
         for task_creator in self.values():
             token_usage = task_creator.token_usage()
-            cached_tokens += token_usage["cached_tokens"]
-            new_tokens += token_usage["new_tokens"]
+            cached, new = token_usage["cached_tokens"], token_usage["new_tokens"]
+            cached_tokens.add_tokens(cached.prompt_tokens, cached.completion_tokens)
+            new_tokens.add_tokens(new.prompt_tokens, new.completion_tokens)
         return InterviewTokenUsage(
             new_token_usage=new_tokens, cached_token_usage=cached_tokens
         )
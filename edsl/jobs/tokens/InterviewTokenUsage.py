@@ -3,6 +3,8 @@ from edsl.enums import TokenPricing
 
 
 class InterviewTokenUsage:
+    __slots__ = ("new_token_usage", "cached_token_usage")
+
     def __init__(
         self, new_token_usage: TokenUsage = None, cached_token_usage: TokenUsage = None
     ):
@@ -2,6 +2,8 @@ from edsl.enums import TokenPricing
 
 
 class TokenUsage:
+    __slots__ = ("from_cache", "prompt_tokens", "completion_tokens")
+
     def __init__(
         self, from_cache: bool, prompt_tokens: int = 0, completion_tokens: int = 0
     ):
@@ -14,7 +14,6 @@ edsl_answer_dict: The parsed JSON response from the model either {'answer': ...}
 
 from __future__ import annotations
 import warnings
-from functools import wraps
 import asyncio
 import json
 import os
@@ -44,7 +43,8 @@ if TYPE_CHECKING:
     from edsl.questions.QuestionBase import QuestionBase
     from edsl.language_models.key_management.KeyLookup import KeyLookup
 
-from edsl.enums import InferenceServiceType
+from edsl.config import CONFIG
+from edsl.enums import InferenceServiceType, service_to_api_keyname
 
 from edsl.utilities.decorators import (
     sync_wrapper,
@@ -62,21 +62,6 @@ from edsl.language_models.key_management.KeyLookupCollection import (
 from edsl.language_models.RawResponseHandler import RawResponseHandler
 
 
-def handle_key_error(func):
-    """Handle KeyError exceptions."""
-
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-            assert True == False
-        except KeyError as e:
-            return f"""KeyError occurred: {e}. This is most likely because the model you are using 
-            returned a JSON object we were not expecting."""
-
-    return wrapper
-
-
 class classproperty:
     def __init__(self, method):
         self.method = method
@@ -109,7 +94,17 @@ class LanguageModel(
     def response_handler(cls):
         key_sequence = cls.key_sequence
         usage_sequence = cls.usage_sequence if hasattr(cls, "usage_sequence") else None
-        return RawResponseHandler(key_sequence, usage_sequence)
+        # Built once per class and reused on every call; rebuilt only if the
+        # class's sequences have been reassigned since.
+        handler = cls.__dict__.get("_response_handler")
+        if (
+            handler is None
+            or handler.key_sequence is not key_sequence
+            or handler.usage_sequence is not usage_sequence
+        ):
+            handler = RawResponseHandler(key_sequence, usage_sequence)
+            cls._response_handler = handler
+        return handler
 
     def __init__(
         self,
@@ -120,7 +115,7 @@ class LanguageModel(
         **kwargs,
     ):
         """Initialize the LanguageModel."""
-        self.model = getattr(self, "_model_", None)
+        self.model = self._model_
         default_parameters = getattr(self, "_parameters_", None)
         parameters = self._overide_default_parameters(kwargs, default_parameters)
         self.parameters = parameters
@@ -215,7 +210,7 @@ class LanguageModel(
     def hello(self, verbose=False):
         """Runs a simple test to check if the model is working."""
         token = self.api_token
-        masked = token[: min(8, len(token))] + "..."
+        masked = f"{token[:8]}..."
         if verbose:
             print(f"Current key is {masked}")
         return self.execute_model_call(
@@ -230,8 +225,6 @@ class LanguageModel(
 
         This method is used to check if the model has a valid API key.
         """
-        from edsl.enums import service_to_api_keyname
-
         if self._model_ == "test":
             return True
 
@@ -248,7 +241,16 @@ class LanguageModel(
         """
         from edsl.utilities.utilities import dict_hash
 
-        return dict_hash(self.to_dict(add_edsl_version=False))
+        # Models are hashed on every bucket lookup; parameters can still be
+        # changed after construction, so the memo is keyed on the state it was
+        # computed from.
+        state = (self.model, tuple(self.parameters.items()))
+        memo = getattr(self, "_hash_memo", None)
+        if memo is not None and memo[0] == state:
+            return memo[1]
+        value = dict_hash(self.to_dict(add_edsl_version=False))
+        self._hash_memo = (state, value)
+        return value
 
     def __eq__(self, other) -> bool:
         """Check is two models are the same.
@@ -259,6 +261,8 @@ class LanguageModel(
         True
 
         """
+        if self is other:
+            return True
         return self.model == other.model and self.parameters == other.parameters
 
     @staticmethod
@@ -302,13 +306,7 @@ class LanguageModel(
     def execute_model_call(self, *args, **kwargs) -> Coroutine:
         """Execute the model call and returns the result as a coroutine."""
 
-        async def main():
-            results = await asyncio.gather(
-                self.async_execute_model_call(*args, **kwargs)
-            )
-            return results[0]  # Since there's only one task, return its result
-
-        return main()
+        return self.async_execute_model_call(*args, **kwargs)
 
     @classmethod
     def get_generated_token_string(cls, raw_response: dict[str, Any]) -> str:
@@ -391,8 +389,6 @@ class LanguageModel(
                 "system_prompt": system_prompt,
                 "files_list": files_list,
             }
-            from edsl.config import CONFIG
-
             TIMEOUT = float(CONFIG.get("EDSL_API_TIMEOUT"))
 
             response = await asyncio.wait_for(f(**params), timeout=TIMEOUT)
@@ -584,17 +580,19 @@ class LanguageModel(
 
         new_instance = deepcopy(self)
         print("Cache entries", len(cache))
-        new_instance.cache = Cache(
-            data={k: v for k, v in cache.items() if v.model == self.model}
-        )
+        data = {}
+        user_prompts = []
+        system_prompts = []
+        for k, v in cache.items():
+            if v.model == self.model:
+                data[k] = v
+                user_prompts.append(v.user_prompt)
+                system_prompts.append(v.system_prompt)
+        new_instance.cache = Cache(data=data)
         print("Cache entries with same model", len(new_instance.cache))
 
-        new_instance.user_prompts = [
-            ce.user_prompt for ce in new_instance.cache.values()
-        ]
-        new_instance.system_prompts = [
-            ce.system_prompt for ce in new_instance.cache.values()
-        ]
+        new_instance.user_prompts = user_prompts
+        new_instance.system_prompts = system_prompts
 
         async def async_execute_model_call(self, user_prompt: str, system_prompt: str):
             cache_call_params = {
@@ -87,14 +87,22 @@ class RawResponseHandler:
 
     @staticmethod
     def convert_answer(response_part):
-        import json
-
         response_part = response_part.strip()
 
         if response_part == "None":
             return None
 
-        repaired = repair_json(response_part)
+        # Most answers are valid JSON already; only fall back to the (much
+        # slower) repair parser when they are not.
+        try:
+            answer = json.loads(response_part)
+        except json.JSONDecodeError:
+            repaired = repair_json(response_part, skip_json_loads=True)
+        else:
+            if answer != "":
+                return answer
+            repaired = repair_json(response_part)
+
         if repaired == '""':
             # it was a literal string
             return response_part
@@ -1,7 +1,7 @@
 from importlib import resources
 from typing import Optional
-from edsl.exceptions.questions import QuestionAnswerValidationError
 from functools import lru_cache
+from edsl.exceptions.questions import QuestionAnswerValidationError
 
 
 class TemplateManager:
@@ -13,20 +13,37 @@ class TemplateManager:
             cls._instance._template_cache = {}
         return cls._instance
 
-    @lru_cache(maxsize=None)
     def get_template(self, question_type, template_name):
-        if (question_type, template_name) not in self._template_cache:
-            with resources.open_text(
-                f"edsl.questions.templates.{question_type}", template_name
-            ) as file:
-                self._template_cache[(question_type, template_name)] = file.read()
-        return self._template_cache[(question_type, template_name)]
+        key = (question_type, template_name)
+        if key not in self._template_cache:
+            self._template_cache[key] = (
+                resources.files(f"edsl.questions.templates.{question_type}")
+                .joinpath(template_name)
+                .read_text(encoding="utf-8")
+            )
+        return self._template_cache[key]
 
 
 # Global instance
 template_manager = TemplateManager()
 
 
+@lru_cache(maxsize=None)
+def _jinja_environment():
+    from jinja2 import Environment
+
+    return Environment()
+
+
+@lru_cache(maxsize=1024)
+def _undeclared_variables(text: str) -> frozenset:
+    """Return the template variables used in text, parsing each text once."""
+    from jinja2 import meta
+
+    parsed_content = _jinja_environment().parse(text)
+    return frozenset(meta.find_undeclared_variables(parsed_content))
+
+
 class QuestionBasePromptsMixin:
     @property
     def model_instructions(self) -> dict:
@@ -42,13 +59,13 @@ class QuestionBasePromptsMixin:
         >>> Q.example()._all_text()
         "how_feelingHow are you?['Good', 'Great', 'OK', 'Bad']"
         """
-        txt = ""
-        for key, value in self.data.items():
+        parts = []
+        for value in self.data.values():
             if isinstance(value, str):
-                txt += value
+                parts.append(value)
             elif isinstance(value, list):
-                txt += "".join(str(value))
-        return txt
+                parts.append(str(value))
+        return "".join(parts)
 
     @model_instructions.setter
     def model_instructions(self, data: dict):
@@ -71,17 +88,13 @@ class QuestionBasePromptsMixin:
         """
         from edsl.language_models.model import Model
 
-        if not hasattr(self, "_model_instructions"):
-            self._model_instructions = {}
         if model is None:
             # if not model is passed, all the models are mapped to this instruction, including 'None'
             self._model_instructions = {
                 model_name: instructions
                 for model_name in Model.available(name_only=True)
             }
-            self._model_instructions.update({model: instructions})
-        else:
-            self._model_instructions.update({model: instructions})
+        self.model_instructions.update({model: instructions})
 
     @classmethod
     def path_to_folder(cls) -> str:
@@ -159,9 +172,9 @@ class QuestionBasePromptsMixin:
             | {
                 "include_comment": getattr(self, "_include_comment", True),
                 "use_code": getattr(self, "_use_code", True),
+                "scenario": scenario,
+                "agent": agent,
             }
-            | ({"scenario": scenario} or {})
-            | ({"agent": agent} or {})
         )
 
     @classmethod
@@ -191,19 +204,14 @@ class QuestionBasePromptsMixin:
     @property
     def parameters(self) -> set[str]:
         """Return the parameters of the question."""
-        from jinja2 import Environment, meta
-
-        env = Environment()
-        # Parse the template
         txt = self._all_text()
         # txt = self.question_text
         # if hasattr(self, "question_options"):
         #    txt += " ".join(self.question_options)
-        parsed_content = env.parse(txt)
-        # Extract undeclared variables
-        variables = meta.find_undeclared_variables(parsed_content)
-        # Return as a list
-        return set(variables)
+        if "{" not in txt:
+            # no Jinja delimiters, so nothing to parse
+            return set()
+        return set(_undeclared_variables(txt))
 
     def get_instructions(self, model: Optional[str] = None) -> type["PromptBase"]:
         """Get the mathcing question-answering instructions for the question.
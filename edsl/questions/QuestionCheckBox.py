@@ -1,5 +1,6 @@
 from __future__ import annotations
 import random
+from functools import lru_cache
 from typing import Any, Optional, Union
 
 from jinja2 import Template
@@ -14,6 +15,7 @@ from edsl.questions.decorators import inject_exception
 
 from pydantic import field_validator
 from edsl.questions.response_validator_abc import ResponseValidatorABC
+from edsl.questions.response_model_cache import cached_response_model
 from edsl.questions.data_structures import BaseResponse
 
 from edsl.exceptions.questions import QuestionAnswerValidationError
@@ -170,6 +172,22 @@ class CheckBoxResponseValidator(ResponseValidatorABC):
         return response.dict()
 
 
+@lru_cache(maxsize=None)
+def _question_html_template() -> Template:
+    """Compile the checkbox HTML template once, on first use."""
+    return Template(
+        """
+        <p>{{ instructions }}</p>
+        {% for option in question_options %} 
+        <div>
+        <input type="checkbox" id="{{ option }}" name="{{ question_name }}" value="{{ option }}">
+        <label for="{{ option }}">{{ option }}</label>
+        </div>
+        {% endfor %}
+        """
+    )
+
+
 class QuestionCheckBox(QuestionBase):
     """This question prompts the agent to select options from a list."""
 
@@ -218,19 +236,16 @@ class QuestionCheckBox(QuestionBase):
 
     def create_response_model(self):
         if not self._use_code:
-            return create_checkbox_response_model(
-                self.question_options,
-                min_selections=self.min_selections,
-                max_selections=self.max_selections,  # include_comment=self._include_comment
-                permissive=self.permissive,
-            )
+            choices = self.question_options
         else:
-            return create_checkbox_response_model(
-                list(range(len(self.question_options))),
-                min_selections=self.min_selections,
-                max_selections=self.max_selections,  # include_comment=self._include_comment
-                permissive=self.permissive,
-            )
+            choices = range(len(self.question_options))
+        return cached_response_model(
+            create_checkbox_response_model,
+            choices,
+            min_selections=self.min_selections,
+            max_selections=self.max_selections,  # include_comment=self._include_comment
+            permissive=self.permissive,
+        )
 
     def _translate_answer_code_to_answer(
         self, answer_codes, scenario: "Scenario" = None
@@ -241,19 +256,15 @@ class QuestionCheckBox(QuestionBase):
         For example, for question options ["a", "b", "c"],the answer codes are 0, 1, and 2.
         The LLM will respond with [0,1] and this code will translate it to ["a","b"].
         """
-        from edsl.scenarios.Scenario import Scenario
+        if not self._use_code:
+            return list(answer_codes)
 
-        scenario = scenario or Scenario()
-        translated_options = [
-            Template(str(option)).render(scenario) for option in self.question_options
+        scenario = scenario or {}
+        # Only render the options that were actually selected
+        return [
+            Template(str(self.question_options[int(answer_code)])).render(scenario)
+            for answer_code in answer_codes
         ]
-        translated_codes = []
-        for answer_code in answer_codes:
-            if self._use_code:
-                translated_codes.append(translated_options[int(answer_code)])
-            else:
-                translated_codes.append(answer_code)
-        return translated_codes
 
     # def _simulate_answer(self, human_readable=True) -> dict[str, Union[int, str]]:
     #     """Simulate a valid answer for debugging purposes."""
@@ -287,17 +298,7 @@ class QuestionCheckBox(QuestionBase):
             instructions += f"Select at least {self.min_selections} option(s). "
         if self.max_selections is not None:
             instructions += f"Select at most {self.max_selections} option(s)."
-        question_html_content = Template(
-            """
-        <p>{{ instructions }}</p>
-        {% for option in question_options %} 
-        <div>
-        <input type="checkbox" id="{{ option }}" name="{{ question_name }}" value="{{ option }}">
-        <label for="{{ option }}">{{ option }}</label>
-        </div>
-        {% endfor %}
-        """
-        ).render(
+        question_html_content = _question_html_template().render(
             instructions=instructions,
             question_name=self.question_name,
             question_options=self.question_options,
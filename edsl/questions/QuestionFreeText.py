@@ -1,7 +1,10 @@
 from __future__ import annotations
+from functools import lru_cache
 from typing import Any, Optional
 from uuid import uuid4
 
+from jinja2 import Template
+
 from pydantic import field_validator
 
 from edsl.questions.QuestionBase import QuestionBase
@@ -43,6 +46,18 @@ class FreeTextResponseValidator(ResponseValidatorABC):
         }
 
 
+@lru_cache(maxsize=None)
+def _question_html_template() -> Template:
+    """Compile the free text HTML template once, on first use."""
+    return Template(
+        """
+        <div>
+        <textarea id="{{ question_name }}" name="{{ question_name }}"></textarea>
+        </div>
+        """
+    )
+
+
 class QuestionFreeText(QuestionBase):
     """This question prompts the agent to respond with free text."""
 
@@ -69,15 +84,9 @@ class QuestionFreeText(QuestionBase):
 
     @property
     def question_html_content(self) -> str:
-        from jinja2 import Template
-
-        question_html_content = Template(
-            """
-        <div>
-        <textarea id="{{ question_name }}" name="{{ question_name }}"></textarea>
-        </div>
-        """
-        ).render(question_name=self.question_name)
+        question_html_content = _question_html_template().render(
+            question_name=self.question_name
+        )
         return question_html_content
 
     @classmethod
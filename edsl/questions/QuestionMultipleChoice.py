@@ -9,6 +9,7 @@ from edsl.questions.QuestionBase import QuestionBase
 from edsl.questions.descriptors import QuestionOptionsDescriptor
 from edsl.questions.decorators import inject_exception
 from edsl.questions.response_validator_abc import ResponseValidatorABC
+from edsl.questions.response_model_cache import cached_response_model
 
 
 def create_response_model(choices: List[str], permissive: bool = False):
@@ -169,11 +170,12 @@ class QuestionMultipleChoice(QuestionBase):
             # The replacement dict that could be from scenario, current answers, etc. to populate the response model
 
         if self.use_code:
-            return create_response_model(
-                list(range(len(self.question_options))), self.permissive
-            )
+            choices = range(len(self.question_options))
         else:
-            return create_response_model(self.question_options, self.permissive)
+            choices = self.question_options
+        return cached_response_model(
+            create_response_model, choices, permissive=self.permissive
+        )
 
     @staticmethod
     def _translate_question_options(
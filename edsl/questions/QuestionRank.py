@@ -190,10 +190,9 @@ class QuestionRank(QuestionBase):
         self, answer_codes, scenario: Scenario = None
     ) -> list[str]:
         """Translate the answer code to the actual answer."""
-        from edsl.scenarios.Scenario import Scenario
         from jinja2 import Template
 
-        scenario = scenario or Scenario()
+        scenario = scenario or {}
         translated_options = [
             Template(option).render(scenario) for option in self.question_options
         ]
@@ -47,9 +47,10 @@ class BaseDescriptor(ABC):
 
     def __get__(self, instance, owner):
         """Get the value of the attribute."""
-        if self.name not in instance.__dict__:
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
             return {}
-        return instance.__dict__[self.name]
 
     def __set__(self, instance, value: Any) -> None:
         """Set the value of the attribute."""
@@ -39,9 +39,7 @@ class Question(metaclass=Meta):
 
     def __new__(cls, question_type, *args, **kwargs):
         """Create a new question object."""
-        get_question_classes = RegisterQuestionsMeta.question_types_to_classes()
-
-        subclass = get_question_classes.get(question_type, None)
+        subclass = RegisterQuestionsMeta.question_class_for_type(question_type)
         if subclass is None:
             raise ValueError(
                 f"No question registered with question_type {question_type}"
@@ -55,8 +53,7 @@ class Question(metaclass=Meta):
     @classmethod
     def example(cls, question_type: str):
         """Return an example question of the given type."""
-        get_question_classes = RegisterQuestionsMeta.question_types_to_classes()
-        q = get_question_classes.get(question_type, None)
+        q = RegisterQuestionsMeta.question_class_for_type(question_type)
         return q.example()
 
     @classmethod
@@ -144,12 +141,13 @@ class Question(metaclass=Meta):
 
 def get_question_class(question_type):
     """Return the class for the given question type."""
-    q2c = RegisterQuestionsMeta.question_types_to_classes()
-    if question_type not in q2c:
+    question_class = RegisterQuestionsMeta.question_class_for_type(question_type)
+    if question_class is None:
+        q2c = RegisterQuestionsMeta.question_types_to_classes()
         raise ValueError(
             f"The question type, {question_type}, is not recognized. Recognied types are: {q2c.keys()}"
         )
-    return q2c.get(question_type)
+    return question_class
 
 
 question_purpose = {
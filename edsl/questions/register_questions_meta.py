@@ -11,6 +11,7 @@ class RegisterQuestionsMeta(ABCMeta):
     """Metaclass to register output elements in a registry i.e., those that have a parent."""
 
     _registry = {}  # Initialize the registry as a dictionary
+    _question_types = None  # question_type -> class; rebuilt after registration
 
     def __init__(cls, name, bases, dct):
         """Initialize the class and adds it to the registry if it's not the base class."""
@@ -49,6 +50,7 @@ class RegisterQuestionsMeta(ABCMeta):
 
         if name != "QuestionBase":
             RegisterQuestionsMeta._registry[name] = cls
+            RegisterQuestionsMeta._question_types = None
 
     @classmethod
     def get_registered_classes(cls):
@@ -60,12 +62,24 @@ class RegisterQuestionsMeta(ABCMeta):
         cls,
     ):
         """Return a dictionary of question types to classes."""
-        d = {}
-        for classname, cls in cls._registry.items():
-            if hasattr(cls, "question_type"):
-                d[cls.question_type] = cls
-            else:
-                raise Exception(
-                    f"Class {classname} does not have a question_type class attribute"
-                )
-        return d
+        return dict(cls._question_type_table())
+
+    @classmethod
+    def question_class_for_type(cls, question_type):
+        """Return the class registered for question_type, or None."""
+        return cls._question_type_table().get(question_type)
+
+    @classmethod
+    def _question_type_table(cls):
+        """Return the shared question_type -> class table, building it if needed."""
+        if RegisterQuestionsMeta._question_types is None:
+            d = {}
+            for classname, question_class in cls._registry.items():
+                if hasattr(question_class, "question_type"):
+                    d[question_class.question_type] = question_class
+                else:
+                    raise Exception(
+                        f"Class {classname} does not have a question_type class attribute"
+                    )
+            RegisterQuestionsMeta._question_types = d
+        return RegisterQuestionsMeta._question_types
@@ -0,0 +1,38 @@
+"""Reuse response model classes across questions with the same options."""
+
+from functools import lru_cache
+from typing import Callable, Iterable
+
+
+def cached_response_model(factory: Callable, choices: Iterable, **kwargs):
+    """Return factory(list(choices), **kwargs), reusing the class for equal inputs.
+
+    Pydantic compiles a model's validator when the class is created, so
+    reusing the class avoids recompiling it for every answer. Choices are
+    keyed as (type, value) pairs because 1, 1.0 and True hash alike.
+    Unhashable options can't be cached and get a freshly built model.
+
+    >>> def factory(choices, permissive=False):
+    ...     return type("Model", (), {"choices": choices})
+    >>> cached_response_model(factory, [0, 1]) is cached_response_model(factory, [0, 1])
+    True
+    >>> cached_response_model(factory, [False, True]).choices
+    [False, True]
+    """
+    choices = list(choices)
+    try:
+        typed_choices = tuple((type(c), c) for c in choices)
+        return _build(factory, typed_choices, tuple(sorted(kwargs.items())))
+    except TypeError:
+        return factory(choices, **kwargs)
+
+
+@lru_cache(maxsize=512)
+def _build(factory: Callable, typed_choices: tuple, kwargs: tuple):
+    return factory([c for _, c in typed_choices], **dict(kwargs))
+
+
+if __name__ == "__main__":
+    import doctest
+
+    doctest.testmod()
@@ -36,7 +36,7 @@ class Dataset(UserList, ResultsExportMixin, PersistenceMixin, HashingMixin):
         >>> len(d)
         4
         """
-        _, values = list(self.data[0].items())[0]
+        _, values = next(iter(self.data[0].items()))
         return len(values)
 
     def tail(self, n: int = 5) -> Dataset:
@@ -48,7 +48,7 @@ class Dataset(UserList, ResultsExportMixin, PersistenceMixin, HashingMixin):
         """
         new_data = []
         for observation in self.data:
-            key, values = list(observation.items())[0]
+            key, values = next(iter(observation.items()))
             new_data.append({key: values[-n:]})
         return Dataset(new_data)
 
@@ -61,7 +61,7 @@ class Dataset(UserList, ResultsExportMixin, PersistenceMixin, HashingMixin):
         """
         new_data = []
         for observation in self.data:
-            key, values = list(observation.items())[0]
+            key, values = next(iter(observation.items()))
             new_data.append({key: values[:n]})
         return Dataset(new_data)
 
@@ -86,7 +86,7 @@ class Dataset(UserList, ResultsExportMixin, PersistenceMixin, HashingMixin):
         >>> d.keys()
         ['a.b']
         """
-        return [list(o.keys())[0] for o in self]
+        return [next(iter(o)) for o in self]
 
     def filter(self, expression):
         return self.to_scenario_list().filter(expression).to_dataset()
@@ -215,7 +215,7 @@ class Dataset(UserList, ResultsExportMixin, PersistenceMixin, HashingMixin):
         """
         potential_matches = []
         for data_dict in self.data:
-            data_key, data_values = list(data_dict.items())[0]
+            data_key, data_values = next(iter(data_dict.items()))
             if key == data_key:
                 return data_values
             if key == data_key.split(".")[-1]:
@@ -240,7 +240,7 @@ class Dataset(UserList, ResultsExportMixin, PersistenceMixin, HashingMixin):
 
         def get_values(d):
             """Get the values of the first key in the dictionary."""
-            return list(d.values())[0]
+            return next(iter(d.values()))
 
         return FirstObject(get_values(self.data[0])[0])
 
@@ -250,7 +250,7 @@ class Dataset(UserList, ResultsExportMixin, PersistenceMixin, HashingMixin):
     def remove_prefix(self) -> Dataset:
         new_data = []
         for observation in self.data:
-            key, values = list(observation.items())[0]
+            key, values = next(iter(observation.items()))
             if "." in key:
                 new_key = key.split(".")[1]
                 new_data.append({new_key: values})
@@ -271,7 +271,7 @@ class Dataset(UserList, ResultsExportMixin, PersistenceMixin, HashingMixin):
     def rename(self, rename_dic) -> Dataset:
         new_data = []
         for observation in self.data:
-            key, values = list(observation.items())[0]
+            key, values = next(iter(observation.items()))
             new_key = rename_dic.get(key, key)
             new_data.append({new_key: values})
         return Dataset(new_data)
@@ -312,7 +312,7 @@ class Dataset(UserList, ResultsExportMixin, PersistenceMixin, HashingMixin):
 
         new_data = []
         for observation in self.data:
-            observation_key = list(observation.keys())[0]
+            observation_key = next(iter(observation))
             if observation_key in keys:
                 new_data.append(observation)
         return Dataset(new_data)
@@ -341,7 +341,7 @@ class Dataset(UserList, ResultsExportMixin, PersistenceMixin, HashingMixin):
         indices = None
 
         for entry in self:
-            key, values = list(entry.items())[0]
+            key, values = next(iter(entry.items()))
             if indices is None:
                 indices = list(range(len(values)))
                 random.shuffle(indices)
@@ -386,7 +386,7 @@ class Dataset(UserList, ResultsExportMixin, PersistenceMixin, HashingMixin):
             raise ValueError("Only one of 'n' or 'frac' should be specified.")
 
         # Get the length of the lists from the first entry
-        first_key, first_values = list(self[0].items())[0]
+        first_key, first_values = next(iter(self[0].items()))
         total_length = len(first_values)
 
         # Determine the number of samples based on 'n' or 'frac'
@@ -406,7 +406,7 @@ class Dataset(UserList, ResultsExportMixin, PersistenceMixin, HashingMixin):
 
         # Apply the same indices to all entries
         for entry in self:
-            key, values = list(entry.items())[0]
+            key, values = next(iter(entry.items()))
             entry[key] = [values[i] for i in indices]
 
         return self
@@ -446,7 +446,7 @@ class Dataset(UserList, ResultsExportMixin, PersistenceMixin, HashingMixin):
 
         number_found = 0
         for obs in self.data:
-            key, values = list(obs.items())[0]
+            key, values = next(iter(obs.items()))
             # an obseration is {'a':[1,2,3,4]}
             # key = list(obs.keys())[0]
             if (
@@ -465,7 +465,7 @@ class Dataset(UserList, ResultsExportMixin, PersistenceMixin, HashingMixin):
         new_data = []
         for observation in self.data:
             # print(observation)
-            key, values = list(observation.items())[0]
+            key, values = next(iter(observation.items()))
             new_values = [values[i] for i in sort_indices_list]
             new_data.append({key: new_values})
 
@@ -5,7 +5,6 @@ import warnings
 import textwrap
 from typing import Optional, Tuple, Union, List
 
-from edsl.results.file_exports import CSVExport, ExcelExport, JSONLExport, SQLiteExport
 
 class DatasetExportMixin:
     """Mixin class for exporting Dataset objects."""
@@ -42,7 +41,7 @@ class DatasetExportMixin:
         ...
         ValueError: No columns found for data type: flimflam. Available data types are: ...
         """
-        columns = [list(x.keys())[0] for x in self]
+        columns = [next(iter(x)) for x in self]
         if remove_prefix:
             columns = [column.split(".")[-1] for column in columns]
 
@@ -76,7 +75,7 @@ class DatasetExportMixin:
         """
         _num_observations = None
         for entry in self:
-            key, values = list(entry.items())[0]
+            key, values = next(iter(entry.items()))
             if _num_observations is None:
                 _num_observations = len(values)
             else:
@@ -105,17 +104,17 @@ class DatasetExportMixin:
 
         def create_dict_from_list_of_dicts(list_of_dicts):
             for entry in list_of_dicts:
-                key, list_of_values = list(entry.items())[0]
+                key, list_of_values = next(iter(entry.items()))
                 yield key, list_of_values
 
         tabular_repr = dict(create_dict_from_list_of_dicts(self.data))
 
-        full_header = [list(x.keys())[0] for x in self]
+        full_header = [next(iter(x)) for x in self]
 
-        rows = []
-        for i in range(self.num_observations()):
-            row = [tabular_repr[h][i] for h in full_header]
-            rows.append(row)
+        # raises if the columns have different lengths
+        self.num_observations()
+        columns = [tabular_repr[h] for h in full_header]
+        rows = [list(row) for row in zip(*columns)]
 
         if remove_prefix:
             header = [h.split(".")[-1] for h in full_header]
@@ -138,7 +137,7 @@ class DatasetExportMixin:
         answer.how_feeling: OK
         """
         for entry in self:
-            key, list_of_values = list(entry.items())[0]
+            key, list_of_values = next(iter(entry.items()))
             for value in list_of_values:
                 print(f"{key}: {value}")
 
@@ -165,6 +164,8 @@ class DatasetExportMixin:
 
     def to_jsonl(self, filename: Optional[str] = None) -> Optional["FileStore"]:
         """Export the results to a FileStore instance containing JSONL data."""
+        from edsl.results.file_exports import JSONLExport
+
         exporter = JSONLExport(data=self, filename=filename)
         return exporter.export()
 
@@ -177,6 +178,8 @@ class DatasetExportMixin:
         if_exists: str = "replace",
     ) -> Optional["FileStore"]:
         """Export the results to a SQLite database file."""
+        from edsl.results.file_exports import SQLiteExport
+
         exporter = SQLiteExport(
             data=self,
             filename=filename,
@@ -194,6 +197,8 @@ class DatasetExportMixin:
         pretty_labels: Optional[dict] = None,
     ) -> Optional["FileStore"]:
         """Export the results to a FileStore instance containing CSV data."""
+        from edsl.results.file_exports import CSVExport
+
         exporter = CSVExport(
             data=self,
             filename=filename,
@@ -210,6 +215,8 @@ class DatasetExportMixin:
         sheet_name: Optional[str] = None,
     ) -> Optional["FileStore"]:
         """Export the results to a FileStore instance containing Excel data."""
+        from edsl.results.file_exports import ExcelExport
+
         exporter = ExcelExport(
             data=self,
             filename=filename,
@@ -381,11 +388,9 @@ class DatasetExportMixin:
         from edsl.scenarios.ScenarioList import ScenarioList
         from edsl.scenarios.Scenario import Scenario
 
-        list_of_dicts = self.to_dicts(remove_prefix=remove_prefix)
-        scenarios = []
-        for d in list_of_dicts:
-            scenarios.append(Scenario(d))
-        return ScenarioList(scenarios)
+        return ScenarioList(
+            [Scenario(d) for d in self.to_dicts(remove_prefix=remove_prefix)]
+        )
 
     def to_agent_list(self, remove_prefix: bool = True):
         """Convert the results to a list of dictionaries, one per agent.
@@ -429,18 +434,14 @@ class DatasetExportMixin:
         list_of_keys = []
         list_of_values = []
         for entry in self:
-            key, values = list(entry.items())[0]
+            key, values = next(iter(entry.items()))
             list_of_keys.append(key)
             list_of_values.append(values)
 
         if remove_prefix:
             list_of_keys = [key.split(".")[-1] for key in list_of_keys]
 
-        list_of_dicts = []
-        for entries in zip(*list_of_values):
-            list_of_dicts.append(dict(zip(list_of_keys, entries)))
-
-        return list_of_dicts
+        return [dict(zip(list_of_keys, entries)) for entries in zip(*list_of_values)]
 
     def to_list(self, flatten=False, remove_none=False, unzipped=False) -> list[list]:
         """Convert the results to a list of lists.
@@ -471,20 +472,21 @@ class DatasetExportMixin:
 
 
         """
-        if len(self.relevant_columns()) > 1 and flatten:
+        keys = self.relevant_columns()
+        if len(keys) > 1 and flatten:
             raise ValueError(
                 "Cannot flatten a list of lists when there are multiple columns selected."
             )
 
-        if len(self.relevant_columns()) == 1:
+        if len(keys) == 1:
             # if only one 'column' is selected (which is typical for this method
-            list_to_return = list(self[0].values())[0]
+            list_to_return = next(iter(self[0].values()))
         else:
-            keys = self.relevant_columns()
-            data = self.to_dicts(remove_prefix=False)
-            list_to_return = []
-            for d in data:
-                list_to_return.append(tuple([d[key] for key in keys]))
+            # transpose the columns straight into row tuples
+            columns = {}
+            for entry in self:
+                columns.update(entry)
+            list_to_return = list(zip(*(columns[key] for key in keys)))
 
         if remove_none:
             list_to_return = [item for item in list_to_return if item is not None]
@@ -557,17 +559,14 @@ class DatasetExportMixin:
         """
         from collections import Counter
 
+        relevant_columns = self.relevant_columns()
         if len(fields) == 0:
-            fields = self.relevant_columns()
+            fields = relevant_columns
 
-        relevant_columns_without_prefix = [
-            column.split(".")[-1] for column in self.relevant_columns()
-        ]
+        known_fields = set(relevant_columns)
+        known_fields.update(column.split(".")[-1] for column in relevant_columns)
 
-        if not all(
-            f in self.relevant_columns() or f in relevant_columns_without_prefix
-            for f in fields
-        ):
+        if not all(f in known_fields for f in fields):
             raise ValueError("One or more specified fields are not in the dataset.")
 
         if len(fields) == 1:
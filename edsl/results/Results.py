@@ -223,6 +223,12 @@ class Results(UserList, Mixins, Base):
     def insert(self, item):
         item_order = getattr(item, "order", None)
         if item_order is not None:
+            # Fast path: results mostly arrive in order, so they usually belong at
+            # the end; only scan the existing orders when they do not.
+            last_order = getattr(self.data[-1], "order", None) if self.data else None
+            if not self.data or (last_order is not None and item_order > last_order):
+                self.data.append(item)
+                return
             # Get list of orders, putting None at the end
             orders = [getattr(x, "order", None) for x in self]
             # Filter to just the non-None orders for bisect
@@ -522,31 +528,6 @@ class Results(UserList, Mixins, Base):
     def hashes(self) -> set:
         return set(hash(result) for result in self.data)
 
-    def sample(self, n: int) -> Results:
-        """Return a random sample of the results.
-
-        :param n: The number of samples to return.
-
-        >>> from edsl.results import Results
-        >>> r = Results.example()
-        >>> len(r.sample(2))
-        2
-        """
-        indices = None
-
-        for entry in self:
-            key, values = list(entry.items())[0]
-            if indices is None:  # gets the indices for the first time
-                indices = list(range(len(values)))
-                sampled_indices = random.sample(indices, n)
-                if n > len(indices):
-                    raise ResultsError(
-                        f"Cannot sample {n} items from a list of length {len(indices)}."
-                    )
-            entry[key] = [values[i] for i in sampled_indices]
-
-        return self
-
     @classmethod
     @remove_edsl_version
     def from_dict(cls, data: dict[str, Any]) -> Results:
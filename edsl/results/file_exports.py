@@ -3,9 +3,6 @@ import io
 import csv
 import base64
 from typing import Optional, Union, Tuple, List, Any, Dict
-from openpyxl import Workbook
-
-from edsl.scenarios.FileStore import FileStore
 
 
 class FileExport(ABC):
@@ -83,7 +80,7 @@ class JSONLExport(FileExport):
     def format_data(self) -> str:
         output = io.StringIO()
         for entry in self.data:
-            key, values = list(entry.items())[0]
+            key, values = next(iter(entry.items()))
             output.write(f'{{"{key}": {values}}}\n')
         return output.getvalue()
 
@@ -103,13 +100,26 @@ class CSVExport(TabularExport):
     suffix = "csv"
     is_binary = False
 
-    def format_data(self) -> str:
-        output = io.StringIO()
+    def _write_rows(self, output) -> None:
         writer = csv.writer(output)
         writer.writerow(self.header)
         writer.writerows(self.rows)
+
+    def format_data(self) -> str:
+        output = io.StringIO()
+        self._write_rows(output)
         return output.getvalue()
 
+    def export(self) -> Optional["FileStore"]:
+        """Export the data, writing rows straight to the file when a filename is given."""
+        if self.filename is None:
+            return super().export()
+
+        with open(self.filename, "w", newline="") as f:
+            self._write_rows(f)
+        print(f"File written to {self.filename}")
+        return None
+
 
 class ExcelExport(TabularExport):
     mime_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
@@ -121,6 +131,8 @@ class ExcelExport(TabularExport):
         self.sheet_name = sheet_name or "Results"
 
     def format_data(self) -> bytes:
+        from openpyxl import Workbook
+
         wb = Workbook()
         ws = wb.active
         ws.title = self.sheet_name
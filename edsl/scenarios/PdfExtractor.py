@@ -20,7 +20,7 @@ class PdfExtractor:
         filename = os.path.basename(self.pdf_path)
 
         # Iterate through each page and extract text
-        text = ""
+        parts = []
         for page_num in range(len(document)):
             page = document.load_page(page_num)
             blocks = page.get_text("blocks")  # Extract text blocks
@@ -30,8 +30,9 @@ class PdfExtractor:
 
             # Combine the text blocks in order
             for block in blocks:
-                text += block[4] + "\n"
+                parts.append(block[4])
+                parts.append("\n")
 
         # Create a dictionary for the combined text
-        page_info = {"filename": filename, "text": text}
+        page_info = {"filename": filename, "text": "".join(parts)}
         return page_info
@@ -121,20 +121,17 @@ class ScenarioListPdfMixin:
                 # For other URLs, use the previous fetch_and_save_pdf function
                 temp_filename = fetch_and_save_pdf(filename_or_url, "temp_pdf.pdf")
 
-            scenarios = list(cls.extract_text_from_pdf(temp_filename))
+            pages = cls.extract_text_from_pdf(temp_filename)
         else:
             # If it's not a URL, assume it's a local file path
-            scenarios = list(cls.extract_text_from_pdf(filename_or_url))
+            pages = cls.extract_text_from_pdf(filename_or_url)
         if not collapse_pages:
-            return cls(scenarios)
+            # ScenarioList consumes the page generator; no intermediate list
+            return cls(pages)
         else:
-            txt = ""
-            for scenario in scenarios:
-                txt += scenario["text"]
-            from edsl.scenarios import Scenario
-
+            scenarios = list(pages)
             base_scenario = copy.copy(scenarios[0])
-            base_scenario["text"] = txt
+            base_scenario["text"] = "".join(scenario["text"] for scenario in scenarios)
         return base_scenario
 
     @staticmethod
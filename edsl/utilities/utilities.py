@@ -56,9 +56,12 @@ def dict_hash(data: dict):
     )
 
 
+_JSON_OBJECT_RE = re.compile(r"\{.*?\}")
+_JSON_ANSWER_OBJECT_RE = re.compile(r'(\{[^\{\}]*"answer"[^\{\}]*\})')
+
+
 def extract_json_from_string(text):
-    pattern = re.compile(r"\{.*?\}")
-    match = pattern.search(text)
+    match = _JSON_OBJECT_RE.search(text)
     if match:
         json_data = match.group(0)
         try:
@@ -76,9 +79,8 @@ def fix_partial_correct_response(text: str) -> dict:
     if answer_key_start == -1:
         return {"error": "No 'answer' key found in the text"}
 
-    # Define regex to find the complete JSON object starting with "answer"
-    json_pattern = r'(\{[^\{\}]*"answer"[^\{\}]*\})'
-    match = re.search(json_pattern, text)
+    # Find the complete JSON object containing "answer"
+    match = _JSON_ANSWER_OBJECT_RE.search(text)
 
     if not match:
         return {"error": "No valid JSON object found"}
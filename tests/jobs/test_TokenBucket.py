@@ -64,3 +64,21 @@ async def test_no_overflow():
     bucket.last_refill = time.monotonic() - 1000
     bucket.refill()
     assert bucket.tokens == 5, "Token count should not exceed capacity"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_wait_refunds_tokens():
+    bucket = TokenBucket(
+        bucket_name="test", bucket_type="requests", capacity=10, refill_rate=10
+    )
+    bucket.tokens = 0
+    waiter = asyncio.create_task(bucket.get_tokens(9))
+    await asyncio.sleep(0.05)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    # the cancelled reservation is handed back, so it no longer delays others
+    assert bucket.tokens > -1
+    start_time = time.monotonic()
+    await bucket.get_tokens(5)
+    assert time.monotonic() - start_time < 1
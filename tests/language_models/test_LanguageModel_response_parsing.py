@@ -75,3 +75,15 @@ def test_str_list_examples():
 #         m = LanguageModel.example(test_model=True, canned_response=generated_tokens)
 #         raw_model_response = m.execute_model_call("", "")
 #         model_response = json.loads(m.parse_response(raw_model_response))
+
+
+def test_convert_answer_valid_and_repaired_json():
+    from edsl.language_models.RawResponseHandler import RawResponseHandler
+
+    convert = RawResponseHandler.convert_answer
+    assert convert("5") == 5
+    assert convert('{"a": 1}') == {"a": 1}
+    assert convert('["a", "b"') == ["a", "b"]
+    assert convert("Yes") == "Yes"
+    assert convert('""') == '""'
+    assert convert("None") is None
@@ -281,3 +281,12 @@ def test_QuestionCheckBox_extras():
     assert isinstance(simulated_answer["answer"], list)
     assert len(simulated_answer["answer"]) <= Settings.MAX_OPTION_LENGTH
     assert len(simulated_answer["answer"]) > 0
+
+
+def test_QuestionCheckBox_response_model_reused():
+    q = QuestionCheckBox(**valid_question)
+    assert q.create_response_model() is q.create_response_model()
+    q.max_selections = 2
+    model = q.create_response_model()
+    with pytest.raises(Exception):
+        model(answer=[0, 1, 2])
@@ -202,6 +202,15 @@ def test_not_using_code():
     q._validate_answer({"answer": "OK"})
 
 
+def test_QuestionMultipleChoice_response_model_reused():
+    q = QuestionMultipleChoice(**valid_question)
+    assert q.create_response_model() is q.create_response_model()
+    strict_model = q.create_response_model()
+    q.permissive = True
+    assert q.create_response_model() is not strict_model
+    assert q.create_response_model()(answer=99).answer == 99
+
+
 def test_QuestionMultipleChoice_extras():
     """Test QuestionFreeText extra functionalities."""
     q = QuestionMultipleChoice(**valid_question)
@@ -0,0 +1,48 @@
+from edsl.questions.QuestionCheckBox import QuestionCheckBox
+from edsl.questions.QuestionMultipleChoice import (
+    QuestionMultipleChoice,
+    create_response_model,
+)
+from edsl.questions.response_model_cache import cached_response_model
+
+
+def test_cached_response_model_reuses_class():
+    model = cached_response_model(create_response_model, ["a", "b"])
+    assert cached_response_model(create_response_model, ("a", "b")) is model
+    assert cached_response_model(create_response_model, ["a", "c"]) is not model
+
+
+def test_cached_response_model_keys_on_option_type():
+    ints = cached_response_model(create_response_model, [0, 1])
+    bools = cached_response_model(create_response_model, [False, True])
+    assert ints is not bools
+    assert bools(answer=True).answer is True
+
+
+def test_cached_response_model_unhashable_options():
+    options = [["a"], ["b"]]
+    model = cached_response_model(create_response_model, options)
+    assert model(answer=["a"]).answer == ["a"]
+
+
+def test_questions_with_equal_options_do_not_share_models():
+    for question_class, int_answer, bool_answer in [
+        (QuestionMultipleChoice, 1, True),
+        (QuestionCheckBox, [1], [True]),
+    ]:
+        ints = question_class(
+            question_name="ints",
+            question_text="Pick",
+            question_options=[0, 1, 2],
+            use_code=False,
+        )
+        assert ints._validate_answer({"answer": int_answer})["answer"] == int_answer
+        bools = question_class(
+            question_name="bools",
+            question_text="Pick",
+            question_options=[False, True, 2],
+            use_code=False,
+        )
+        answer = bools._validate_answer({"answer": bool_answer})["answer"]
+        first = answer[0] if isinstance(answer, list) else answer
+        assert first is True
@@ -183,6 +183,9 @@ class TestResults(unittest.TestCase):
                 rows = list(reader)
                 assert len(rows) == len(self.example_results) + 1
 
+            with open(tmpdirname + "/test.csv", newline="") as f:
+                assert f.read() == self.example_results.to_csv().text
+
 
 if __name__ == "__main__":
     unittest.main()